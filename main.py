@@ -1,11 +1,40 @@
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field
-from typing import List
+from fastapi import FastAPI, HTTPException, Path, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Dict, List, Optional
+from contextlib import asynccontextmanager, suppress
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 import gspread
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import absolute_range_name
 from google.oauth2.service_account import Credentials
+from google.auth.exceptions import TransportError
+from google.auth.transport.requests import AuthorizedSession, Request as AuthRequest
+from requests.exceptions import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import datetime
+import functools
+import hashlib
+import logging
+import threading
 import os
 import json
 import base64
+import orjson
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    refresher = asyncio.create_task(keep_credentials_fresh())
+    yield
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
 
 app = FastAPI(
     title="Google Sheets API",
@@ -17,7 +46,10 @@ app = FastAPI(
         "- **Examples:** See the request body examples for PATCH endpoints below."
     ),
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # -------------------------------------------------------------------
 # 1) AUTHENTICATION / CLIENT INIT
@@ -27,53 +59,403 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive"  # Needed to list spreadsheets in Drive
 ]
 
-# Load the base64-encoded service account JSON from an environment variable
-service_account_b64 = os.environ.get("SERVICE_ACCOUNT_B64")
-if not service_account_b64:
-    raise Exception("Environment variable SERVICE_ACCOUNT_B64 not found.")
+# gspread is blocking, so every call is dispatched to a dedicated thread pool
+# instead of Starlette's shared one. Size it to the Google API quota you want
+# to allow in flight at once. It lives as long as the process, so it is not
+# shut down when the app's lifespan ends.
+GSPREAD_MAX_WORKERS = int(os.environ.get("GSPREAD_MAX_WORKERS", "32"))
+gspread_executor = ThreadPoolExecutor(
+    max_workers=GSPREAD_MAX_WORKERS, thread_name_prefix="gspread"
+)
+
+# google-auth treats a token as expired this long before its real expiry and
+# then refreshes it synchronously on the request path (mirrors the private
+# google.auth._helpers.REFRESH_THRESHOLD).
+GOOGLE_AUTH_REFRESH_THRESHOLD = datetime.timedelta(minutes=3, seconds=45)
 
-# Decode the base64 string and load the JSON into a dict
-service_account_info = json.loads(base64.b64decode(service_account_b64))
+# Refresh the access token this long before it expires so no request has to.
+CREDENTIALS_REFRESH_MARGIN = GOOGLE_AUTH_REFRESH_THRESHOLD + datetime.timedelta(seconds=60)
+CREDENTIALS_RETRY_DELAY = 30
+
+# Built once per process on first use. The lock makes sure concurrent cold
+# requests share one Credentials/Client instead of each building their own, so
+# the background refresher and the session always see the same token.
+_creds: Optional[Credentials] = None
+_gc: Optional[gspread.Client] = None
+_client_lock = threading.RLock()
+
+def get_creds() -> Credentials:
+    """
+    Decode the base64 service account JSON from SERVICE_ACCOUNT_B64 on first use.
+    Failures raise a 503 and are not cached, so the next request tries again.
+    """
+    global _creds
+    if _creds is None:
+        with _client_lock:
+            if _creds is None:
+                _creds = _load_creds()
+    return _creds
+
+def _load_creds() -> Credentials:
+    service_account_b64 = os.environ.get("SERVICE_ACCOUNT_B64")
+    if not service_account_b64:
+        raise HTTPException(status_code=503, detail="Environment variable SERVICE_ACCOUNT_B64 not found.")
+    try:
+        service_account_info = json.loads(base64.b64decode(service_account_b64))
+        return Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=503, detail=f"Invalid service account credentials: {e}")
+
+def get_gc() -> gspread.Client:
+    """
+    Return the process-wide gspread client, creating it on first use.
+    """
+    global _gc
+    if _gc is None:
+        with _client_lock:
+            if _gc is None:
+                _gc = _build_gc()
+    return _gc
+
+def _build_gc() -> gspread.Client:
+    """
+    Create the gspread client.
 
-# Create credentials from the service account info
-creds = Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
+    It runs on one pooled, keep-alive session shared by every gspread call, so
+    requests reuse warm TLS connections instead of handshaking each time. The
+    pool holds at least one connection per gspread worker thread. Rate-limit
+    and transient server errors are retried with backoff inside the pool, for
+    idempotent methods only, before gspread ever sees them.
+    """
+    creds = get_creds()
+    session = AuthorizedSession(creds)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=GSPREAD_MAX_WORKERS,
+        pool_maxsize=max(GSPREAD_MAX_WORKERS, 64),
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            # Hand the last response back to gspread so it raises APIError with
+            # Google's real status instead of a urllib3 MaxRetryError.
+            raise_on_status=False,
+        ),
+    ))
+    return gspread.Client(auth=creds, session=session)
+
+def utcnow() -> datetime.datetime:
+    """
+    Current UTC time as a naive datetime, matching google-auth's `expiry`.
+    """
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
 
-gc = gspread.authorize(creds)
+async def keep_credentials_fresh() -> None:
+    """
+    Background task that refreshes the access token shortly before it expires.
+    """
+    auth_request = AuthRequest()
+    warned_unconfigured = False
+    while True:
+        delay = CREDENTIALS_RETRY_DELAY
+        try:
+            creds = await run_gs(get_creds)
+            if not creds.valid or creds.expiry - utcnow() <= CREDENTIALS_REFRESH_MARGIN:
+                await run_gs(creds.refresh, auth_request)
+            delay = (creds.expiry - utcnow() - CREDENTIALS_REFRESH_MARGIN).total_seconds()
+        except HTTPException as e:
+            # Missing or invalid SERVICE_ACCOUNT_B64; every request already
+            # reports it as a 503, so only mention it once here.
+            if not warned_unconfigured:
+                logger.warning("Google credentials unavailable: %s", e.detail)
+                warned_unconfigured = True
+        except Exception:
+            logger.exception("Failed to refresh Google credentials; retrying shortly.")
+        await asyncio.sleep(max(delay, 1))
 
 # -------------------------------------------------------------------
 # 2) Pydantic MODELS WITH EXAMPLES
 # -------------------------------------------------------------------
+# Address types. Malformed addresses are rejected with a 422 here instead of
+# costing a Google API call. Values are upper-cased after matching. Ranges are
+# always relative to the worksheet in the URL, so sheet-qualified ranges
+# ("Other!B14") are rejected too.
+_CELL_PATTERN = r"[A-Za-z]{1,3}[1-9][0-9]*"
+_A1_RANGE_PATTERN = (
+    rf"^(?:{_CELL_PATTERN}(?::{_CELL_PATTERN})?"
+    r"|[A-Za-z]{1,3}:[A-Za-z]{1,3}"
+    r"|[1-9][0-9]*:[1-9][0-9]*)$"
+)
+CellAddress = Annotated[str, StringConstraints(pattern=rf"^{_CELL_PATTERN}$", to_upper=True)]
+A1Range = Annotated[str, StringConstraints(pattern=_A1_RANGE_PATTERN, to_upper=True)]
+ColumnLetter = Annotated[str, StringConstraints(pattern=r"^[A-Za-z]{1,3}$", to_upper=True)]
+# Sheets caps a spreadsheet at 10 million cells, so no row number can exceed it.
+MAX_ROWS = 10_000_000
+RowNumber = Annotated[int, Path(ge=1, le=MAX_ROWS)]
+
+# Google Sheets rejects cells longer than 50,000 characters, so oversized
+# values are refused during validation instead.
+CellValue = Annotated[str, StringConstraints(max_length=50000)]
+
 class UpdateCellModel(BaseModel):
-    value: str = Field(..., example="Hello, World!")
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    value: CellValue = Field(..., json_schema_extra={"example": "Hello, World!"})
 
 class UpdateRowModel(BaseModel):
-    values: List[str] = Field(..., example=["Row value 1", "Row value 2", "Row value 3"])
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    values: List[CellValue] = Field(..., json_schema_extra={"example": ["Row value 1", "Row value 2", "Row value 3"]})
 
 class UpdateColumnModel(BaseModel):
-    values: List[str] = Field(..., example=["Column value 1", "Column value 2", "Column value 3"])
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    values: List[CellValue] = Field(..., json_schema_extra={"example": ["Column value 1", "Column value 2", "Column value 3"]})
+
+class BatchUpdateItem(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    range: A1Range = Field(..., json_schema_extra={"example": "A1:B2"})
+    values: List[List[CellValue]] = Field(..., json_schema_extra={"example": [["A1 value", "B1 value"], ["A2 value", "B2 value"]]})
+
 
 # -------------------------------------------------------------------
 # 3) HELPER FUNCTIONS
 # -------------------------------------------------------------------
+# Google Sheets caps a worksheet at 18,278 columns (A..ZZZ), so both directions
+# of the column mapping are precomputed once at import time.
+MAX_COLUMNS = 18278
+
+_IDX_TO_LETTER = [""] * (MAX_COLUMNS + 1)
+_LETTER_TO_IDX = {}
+for _i in range(1, MAX_COLUMNS + 1):
+    _n, _s = _i, ""
+    while _n:
+        _n, _r = divmod(_n - 1, 26)
+        _s = chr(65 + _r) + _s
+    _IDX_TO_LETTER[_i] = _s
+    _LETTER_TO_IDX[_s] = _i
+del _i, _n, _s, _r
+
 def column_letter_to_index(letter: str) -> int:
     """
     Convert a column letter (e.g., 'B', 'AA') to a 1-indexed column number.
     """
-    letter = letter.upper()
-    result = 0
-    for char in letter:
-        result = result * 26 + (ord(char) - ord('A') + 1)
-    return result
+    try:
+        return _LETTER_TO_IDX[letter.upper()]
+    except KeyError:
+        raise HTTPException(status_code=422, detail=f"Invalid column letter '{letter}'.")
 
 def column_index_to_letter(index: int) -> str:
     """
     Convert a 1-indexed column number to its corresponding Excel column letter.
     """
-    result = ""
-    while index:
-        index, remainder = divmod(index - 1, 26)
-        result = chr(65 + remainder) + result
-    return result
+    if not 1 <= index <= MAX_COLUMNS:
+        raise HTTPException(status_code=422, detail=f"Invalid column index {index}.")
+    return _IDX_TO_LETTER[index]
+
+# Column path parameter already converted to its 1-indexed number, so handlers
+# receive an int and never parse the letter themselves.
+ColumnIndex = Annotated[ColumnLetter, AfterValidator(column_letter_to_index)]
+
+async def run_gs(fn, *args, **kwargs):
+    """
+    Run a blocking gspread call in the gspread thread pool and await its result.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        gspread_executor, functools.partial(fn, *args, **kwargs)
+    )
+
+# Values are read and written by worksheet title through the Sheets values API,
+# so these calls need no open_by_key()/worksheet() metadata lookups at all.
+def write_ranges(
+    spreadsheet_id: str,
+    worksheet_title: str,
+    data: List[dict],
+    value_input_option: str = "USER_ENTERED"
+) -> None:
+    """
+    Write several `{"range": ..., "values": [[...]]}` blocks in one API call.
+    """
+    get_gc().http_client.values_batch_update(spreadsheet_id, body={
+        "valueInputOption": value_input_option,
+        "data": [
+            {"range": absolute_range_name(worksheet_title, item["range"]), "values": item["values"]}
+            for item in data
+        ],
+    })
+
+def read_ranges(
+    spreadsheet_id: str,
+    worksheet_title: str,
+    ranges: List[str],
+    major_dimension: str = "ROWS"
+) -> List[List[List[str]]]:
+    """
+    Read several A1 ranges in one API call.
+    """
+    response = get_gc().http_client.values_batch_get(
+        spreadsheet_id,
+        [absolute_range_name(worksheet_title, r) for r in ranges],
+        params={"majorDimension": major_dimension}
+    )
+    return [value_range.get("values", []) for value_range in response.get("valueRanges", [])]
+
+# Errors from Google (or from reaching it) that endpoints translate into HTTP
+# responses. Anything else is a bug and is left to FastAPI's 500 handling.
+GOOGLE_API_ERRORS = (APIError, SpreadsheetNotFound, WorksheetNotFound, TransportError, RequestException)
+
+def google_error_to_http(e: Exception) -> HTTPException:
+    """
+    Translate a gspread / Google transport error into an HTTPException.
+    Client errors keep Google's status code, except a 401, which means this
+    service's credentials were rejected and becomes a 502. Rate limits and
+    outages become a 503 with Retry-After so callers know to back off.
+    """
+    if isinstance(e, (SpreadsheetNotFound, WorksheetNotFound)):
+        return HTTPException(status_code=404, detail=str(e))
+    if isinstance(e, APIError):
+        status_code = e.response.status_code
+        if status_code in (429, 503):
+            retry_after = e.response.headers.get("Retry-After", "1")
+            return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": retry_after})
+        if status_code >= 500:
+            return HTTPException(status_code=502, detail=str(e))
+        if status_code == 401:
+            # Google rejected this service's own credentials; not the caller's fault.
+            return HTTPException(status_code=502, detail=str(e))
+        if status_code == 400 and e.error.get("message", "").startswith("Unable to parse range"):
+            # Ranges are validated locally, so for title-addressed values calls
+            # this means the worksheet title does not exist, same as get_ws().
+            return HTTPException(status_code=404, detail=str(e))
+        return HTTPException(status_code=status_code, detail=str(e))
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+def etag_response(request: Request, content: dict) -> Response:
+    """
+    Serialize `content` and tag it with a weak ETag, answering 304 Not Modified
+    when the client's If-None-Match already holds that tag.
+    """
+    payload = orjson.dumps(content)
+    etag = f'W/"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+# Only the worksheet properties list_worksheets reports are requested.
+WORKSHEET_METADATA_FIELDS = "sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))"
+
+# Spreadsheet / Worksheet handles are cached so each request does not pay for
+# the open_by_key() and worksheet() metadata round trips again.
+_spreadsheet_cache = TTLCache(maxsize=256, ttl=300)
+_worksheet_cache = TTLCache(maxsize=1024, ttl=300)
+_cache_lock = threading.Lock()
+
+def get_sh(spreadsheet_id: str) -> gspread.Spreadsheet:
+    """
+    Return the Spreadsheet for `spreadsheet_id`, opening it on a cache miss.
+    """
+    with _cache_lock:
+        sh = _spreadsheet_cache.get(spreadsheet_id)
+    if sh is None:
+        sh = get_gc().open_by_key(spreadsheet_id)
+        with _cache_lock:
+            _spreadsheet_cache[spreadsheet_id] = sh
+    return sh
+
+def get_ws(spreadsheet_id: str, worksheet_title: str) -> gspread.Worksheet:
+    """
+    Return the Worksheet titled `worksheet_title`, resolving it on a cache miss.
+    """
+    key = (spreadsheet_id, worksheet_title)
+    with _cache_lock:
+        ws = _worksheet_cache.get(key)
+    if ws is None:
+        ws = get_sh(spreadsheet_id).worksheet(worksheet_title)
+        with _cache_lock:
+            _worksheet_cache[key] = ws
+    return ws
+
+def invalidate_ws(spreadsheet_id: str, worksheet_title: str) -> None:
+    """
+    Drop a cached Worksheet, e.g. after its grid size has changed.
+    """
+    with _cache_lock:
+        _worksheet_cache.pop((spreadsheet_id, worksheet_title), None)
+
+# Identical reads arriving together share one in-flight gspread call, and its
+# result is reused for READ_CACHE_TTL seconds. Keys start with
+# (spreadsheet_id, worksheet_title) so writes can drop them. Each write also
+# bumps the worksheet's generation, so a read that was already in flight is
+# never cached once it finishes. These structures are only touched from the
+# event loop thread.
+READ_CACHE_TTL = float(os.environ.get("READ_CACHE_TTL", "1"))
+_read_cache = TTLCache(maxsize=4096, ttl=READ_CACHE_TTL)
+_inflight_reads: Dict[tuple, asyncio.Future] = {}
+_read_generations: Dict[tuple, int] = {}
+_MISSING = object()
+
+async def coalesced_read(key: tuple, fn, *args, **kwargs):
+    """
+    Run a blocking read once for all concurrent callers sharing `key`.
+    """
+    cached = _read_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+    task = _inflight_reads.get(key)
+    if task is None:
+        generation = _read_generations.get(key[:2], 0)
+        task = asyncio.ensure_future(run_gs(fn, *args, **kwargs))
+        _inflight_reads[key] = task
+
+        def _done(task):
+            if _inflight_reads.get(key) is task:
+                del _inflight_reads[key]
+            if task.cancelled() or task.exception() is not None:
+                return
+            if _read_generations.get(key[:2], 0) == generation:
+                _read_cache[key] = task.result()
+        task.add_done_callback(_done)
+    # Shielded so one caller disconnecting does not cancel the shared call.
+    return await asyncio.shield(task)
+
+def invalidate_reads(spreadsheet_id: str, worksheet_title: str) -> None:
+    """
+    Drop cached and in-flight reads for a worksheet after it has been written to.
+    """
+    worksheet = (spreadsheet_id, worksheet_title)
+    _read_generations[worksheet] = _read_generations.get(worksheet, 0) + 1
+    for key in [k for k in _read_cache if k[:2] == worksheet]:
+        _read_cache.pop(key, None)
+    for key in [k for k in _inflight_reads if k[:2] == worksheet]:
+        del _inflight_reads[key]
+
+async def delete_row_range(spreadsheet_id: str, worksheet_title: str, start: int, end: int) -> None:
+    """
+    Delete rows `start`..`end` (inclusive, 1-indexed) in one API call.
+    """
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be greater than end.")
+    ws = await run_gs(get_ws, spreadsheet_id, worksheet_title)
+    await run_gs(ws.delete_rows, start, end)
+    invalidate_ws(spreadsheet_id, worksheet_title)
+    invalidate_reads(spreadsheet_id, worksheet_title)
+
+async def delete_column_range(spreadsheet_id: str, worksheet_title: str, start: int, end: int) -> None:
+    """
+    Delete columns `start`..`end` (inclusive, 1-indexed) in one API call.
+    """
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be greater than end.")
+    ws = await run_gs(get_ws, spreadsheet_id, worksheet_title)
+    await run_gs(ws.delete_columns, start, end)
+    invalidate_ws(spreadsheet_id, worksheet_title)
+    invalidate_reads(spreadsheet_id, worksheet_title)
 
 # -------------------------------------------------------------------
 # 4) ENDPOINTS
@@ -81,23 +463,24 @@ def column_index_to_letter(index: int) -> str:
 
 # ------------------ 4.1: List All Spreadsheets --------------------
 @app.get("/spreadsheets", tags=["Spreadsheets"])
-def list_spreadsheets():
+async def list_spreadsheets(request: Request):
     """
     **List Spreadsheets**
 
     Retrieve a list of spreadsheets accessible by the service account.
     """
     try:
-        spreadsheets = gc.openall()
+        gc = await run_gs(get_gc)
+        spreadsheets = await run_gs(gc.openall)
         result = [{"title": sh.title, "id": sh.id} for sh in spreadsheets]
-        return {"spreadsheets": result}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        return etag_response(request, {"spreadsheets": result})
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.2: List Worksheets in a Spreadsheet --------------------
 @app.get("/spreadsheets/{spreadsheet_id}/worksheets", tags=["Worksheets"])
-def list_worksheets(spreadsheet_id: str):
+async def list_worksheets(request: Request, spreadsheet_id: str):
     """
     **List Worksheets**
 
@@ -114,56 +497,69 @@ def list_worksheets(spreadsheet_id: str):
     ```
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
+        gc = await run_gs(get_gc)
+        metadata = await run_gs(
+            gc.http_client.fetch_sheet_metadata, spreadsheet_id,
+            params={"includeGridData": "false", "fields": WORKSHEET_METADATA_FIELDS}
+        )
         worksheets_info = []
-        for ws in sh.worksheets():
+        for sheet in metadata.get("sheets", []):
+            properties = sheet["properties"]
+            grid = properties.get("gridProperties", {})
             worksheets_info.append({
-                "title": ws.title,
-                "id": ws.id,
-                "rows": ws.row_count,
-                "cols": ws.col_count
+                "title": properties["title"],
+                "id": properties["sheetId"],
+                "rows": grid.get("rowCount"),
+                "cols": grid.get("columnCount")
             })
-        return {"worksheets": worksheets_info}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        return etag_response(request, {"worksheets": worksheets_info})
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.3: Get Worksheet Data (Paginated by Row) --------------------
 @app.get("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}", tags=["Worksheets"])
-def get_worksheet_data(
+async def get_worksheet_data(
+    request: Request,
     spreadsheet_id: str,
     worksheet_title: str,
-    start_row: int = Query(1, description="Starting row for pagination (default is 1)"),
-    end_row: int = Query(10, description="Ending row for pagination (default is 10)")
+    start_row: int = Query(1, ge=1, le=MAX_ROWS, description="Starting row for pagination (default is 1)"),
+    end_row: int = Query(10, ge=1, le=MAX_ROWS, description="Ending row for pagination (default is 10)")
 ):
     """
     **Get Worksheet Data**
 
     Retrieve data from a specific worksheet using pagination by row range.
+    All of the worksheet's columns are returned, with cells as unformatted values.
     
     **Example:**  
     GET `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1?start_row=1&end_row=10`
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        data_range = f"A{start_row}:Z{end_row}"  # Adjust if more columns are needed.
-        data = ws.get(data_range)
-        return {
+        ws = await run_gs(get_ws, spreadsheet_id, worksheet_title)
+        last_column_letter = column_index_to_letter(ws.col_count)
+        data_range = f"A{start_row}:{last_column_letter}{end_row}"
+        data = await coalesced_read(
+            (spreadsheet_id, worksheet_title, "data", data_range),
+            ws.get, data_range,
+            major_dimension="ROWS",
+            value_render_option="UNFORMATTED_VALUE"
+        )
+        return etag_response(request, {
             "worksheet": worksheet_title,
             "range": data_range,
             "data": data
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        })
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.4: Update a Single Cell --------------------
 @app.patch("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/cell/{cell_address}", tags=["Worksheets"])
-def update_single_cell(
+async def update_single_cell(
     spreadsheet_id: str,
     worksheet_title: str,
-    cell_address: str,
+    cell_address: CellAddress,
     body: UpdateCellModel
 ):
     """
@@ -182,20 +578,20 @@ def update_single_cell(
     PATCH `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/cell/B14`
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        ws.update_acell(cell_address, body.value)
+        await run_gs(write_ranges, spreadsheet_id, worksheet_title, [{"range": cell_address, "values": [[body.value]]}])
+        invalidate_reads(spreadsheet_id, worksheet_title)
         return {"message": f"Cell {cell_address} updated with value '{body.value}'."}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.5: Get a Single Cell Value --------------------
 @app.get("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/cell/{cell_address}", tags=["Worksheets"])
-def get_single_cell(
+async def get_single_cell(
+    request: Request,
     spreadsheet_id: str,
     worksheet_title: str,
-    cell_address: str
+    cell_address: CellAddress
 ):
     """
     **Get Single Cell**
@@ -203,20 +599,23 @@ def get_single_cell(
     Retrieve the value of a single cell (e.g., 'B14') in a worksheet.
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        value = ws.acell(cell_address).value
-        return {"cell": cell_address, "value": value}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        values = (await coalesced_read(
+            (spreadsheet_id, worksheet_title, "cell", cell_address),
+            read_ranges, spreadsheet_id, worksheet_title, [cell_address]
+        ))[0]
+        value = values[0][0] if values and values[0] else None
+        return etag_response(request, {"cell": cell_address, "value": value})
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.6: Get an Entire Row --------------------
 @app.get("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/row/{row_number}", tags=["Worksheets"])
-def get_row(
+async def get_row(
+    request: Request,
     spreadsheet_id: str,
     worksheet_title: str,
-    row_number: int
+    row_number: RowNumber
 ):
     """
     **Get Row**
@@ -227,20 +626,23 @@ def get_row(
     GET `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/row/5`
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        row_values = ws.row_values(row_number)
-        return {"row": row_number, "values": row_values}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        values = (await coalesced_read(
+            (spreadsheet_id, worksheet_title, "row", row_number),
+            read_ranges, spreadsheet_id, worksheet_title, [f"{row_number}:{row_number}"]
+        ))[0]
+        row_values = values[0] if values else []
+        return etag_response(request, {"row": row_number, "values": row_values})
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.7: Get an Entire Column --------------------
-@app.get("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/column/{column_letter}", tags=["Worksheets"])
-def get_column(
+@app.get("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/column/{column}", tags=["Worksheets"])
+async def get_column(
+    request: Request,
     spreadsheet_id: str,
     worksheet_title: str,
-    column_letter: str
+    column: ColumnIndex
 ):
     """
     **Get Column**
@@ -251,21 +653,24 @@ def get_column(
     GET `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/column/B`
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        col_index = column_letter_to_index(column_letter)
-        col_values = ws.col_values(col_index)
-        return {"column": column_letter.upper(), "values": col_values}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        column_letter = column_index_to_letter(column)
+        values = (await coalesced_read(
+            (spreadsheet_id, worksheet_title, "column", column),
+            read_ranges, spreadsheet_id, worksheet_title, [f"{column_letter}:{column_letter}"],
+            major_dimension="COLUMNS"
+        ))[0]
+        col_values = values[0] if values else []
+        return etag_response(request, {"column": column_letter, "values": col_values})
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.8: Delete (Clear) a Single Cell --------------------
 @app.delete("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/cell/{cell_address}", tags=["Worksheets"])
-def delete_cell(
+async def delete_cell(
     spreadsheet_id: str,
     worksheet_title: str,
-    cell_address: str
+    cell_address: CellAddress
 ):
     """
     **Delete (Clear) a Cell**
@@ -274,20 +679,19 @@ def delete_cell(
     _Note: This operation clears the cell content rather than deleting its structure._
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        ws.update_acell(cell_address, "")
+        await run_gs(write_ranges, spreadsheet_id, worksheet_title, [{"range": cell_address, "values": [[""]]}])
+        invalidate_reads(spreadsheet_id, worksheet_title)
         return {"message": f"Cell {cell_address} cleared."}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.9: Delete an Entire Row --------------------
 @app.delete("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/row/{row_number}", tags=["Worksheets"])
-def delete_row(
+async def delete_row(
     spreadsheet_id: str,
     worksheet_title: str,
-    row_number: int
+    row_number: RowNumber
 ):
     """
     **Delete Row**
@@ -295,20 +699,18 @@ def delete_row(
     Delete an entire row from a worksheet.
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        ws.delete_rows(row_number)
+        await delete_row_range(spreadsheet_id, worksheet_title, row_number, row_number)
         return {"message": f"Row {row_number} deleted."}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.10: Delete an Entire Column --------------------
-@app.delete("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/column/{column_letter}", tags=["Worksheets"])
-def delete_column(
+@app.delete("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/column/{column}", tags=["Worksheets"])
+async def delete_column(
     spreadsheet_id: str,
     worksheet_title: str,
-    column_letter: str
+    column: ColumnIndex
 ):
     """
     **Delete Column**
@@ -316,21 +718,18 @@ def delete_column(
     Delete an entire column from a worksheet.
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
-        col_index = column_letter_to_index(column_letter)
-        ws.delete_column(col_index)
-        return {"message": f"Column {column_letter.upper()} deleted."}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        await delete_column_range(spreadsheet_id, worksheet_title, column, column)
+        return {"message": f"Column {column_index_to_letter(column)} deleted."}
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.11: Update an Entire Row --------------------
 @app.patch("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/row/{row_number}", tags=["Worksheets"])
-def update_row(
+async def update_row(
     spreadsheet_id: str,
     worksheet_title: str,
-    row_number: int,
+    row_number: RowNumber,
     body: UpdateRowModel
 ):
     """
@@ -350,25 +749,28 @@ def update_row(
     PATCH `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/row/5`
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
         num_values = len(body.values)
         if num_values == 0:
             raise HTTPException(status_code=400, detail="No values provided for the row update.")
         end_column_letter = column_index_to_letter(num_values)
         cell_range = f"A{row_number}:{end_column_letter}{row_number}"
-        ws.update(cell_range, [body.values])
+        await run_gs(
+            write_ranges, spreadsheet_id, worksheet_title,
+            [{"range": cell_range, "values": [body.values]}],
+            value_input_option="RAW"
+        )
+        invalidate_reads(spreadsheet_id, worksheet_title)
         return {"message": f"Row {row_number} updated.", "values": body.values}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
 
 
 # ------------------ 4.12: Update an Entire Column --------------------
-@app.patch("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/column/{column_letter}", tags=["Worksheets"])
-def update_column(
+@app.patch("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/column/{column}", tags=["Worksheets"])
+async def update_column(
     spreadsheet_id: str,
     worksheet_title: str,
-    column_letter: str,
+    column: ColumnIndex,
     body: UpdateColumnModel
 ):
     """
@@ -388,14 +790,124 @@ def update_column(
     PATCH `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/column/B`
     """
     try:
-        sh = gc.open_by_key(spreadsheet_id)
-        ws = sh.worksheet(worksheet_title)
         num_values = len(body.values)
         if num_values == 0:
             raise HTTPException(status_code=400, detail="No values provided for the column update.")
-        cell_range = f"{column_letter.upper()}1:{column_letter.upper()}{num_values}"
+        column_letter = column_index_to_letter(column)
+        cell_range = f"{column_letter}1:{column_letter}{num_values}"
         column_values = [[val] for val in body.values]
-        ws.update(cell_range, column_values)
-        return {"message": f"Column {column_letter.upper()} updated.", "values": body.values}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        await run_gs(
+            write_ranges, spreadsheet_id, worksheet_title,
+            [{"range": cell_range, "values": column_values}],
+            value_input_option="RAW"
+        )
+        invalidate_reads(spreadsheet_id, worksheet_title)
+        return {"message": f"Column {column_letter} updated.", "values": body.values}
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
+
+
+# ------------------ 4.13: Batch Update Ranges --------------------
+@app.patch("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/batch", tags=["Worksheets"])
+async def batch_update_ranges(
+    spreadsheet_id: str,
+    worksheet_title: str,
+    body: List[BatchUpdateItem]
+):
+    """
+    **Batch Update Ranges**
+
+    Update several cells or ranges in a worksheet with a single Google API call.
+
+    **Example Request Body:**
+    ```json
+    [
+      {"range": "B14", "values": [["Hello, World!"]]},
+      {"range": "A1:B2", "values": [["A1", "B1"], ["A2", "B2"]]}
+    ]
+    ```
+    """
+    try:
+        if not body:
+            raise HTTPException(status_code=400, detail="No ranges provided for the batch update.")
+        data = [{"range": item.range, "values": item.values} for item in body]
+        await run_gs(write_ranges, spreadsheet_id, worksheet_title, data)
+        invalidate_reads(spreadsheet_id, worksheet_title)
+        return {"message": f"{len(data)} range(s) updated.", "ranges": [item.range for item in body]}
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
+
+
+# ------------------ 4.14: Batch Get Ranges --------------------
+@app.get("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/batch", tags=["Worksheets"])
+async def batch_get_ranges(
+    request: Request,
+    spreadsheet_id: str,
+    worksheet_title: str,
+    ranges: Annotated[List[A1Range], Query(description="A1 ranges to read, e.g. `ranges=B14&ranges=A1:C3`")]
+):
+    """
+    **Batch Get Ranges**
+
+    Retrieve several cells or ranges from a worksheet with a single Google API call.
+
+    **Example:**  
+    GET `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/batch?ranges=B14&ranges=A1:C3`
+    """
+    try:
+        results = await coalesced_read(
+            (spreadsheet_id, worksheet_title, "batch", tuple(ranges)),
+            read_ranges, spreadsheet_id, worksheet_title, ranges
+        )
+        return etag_response(request, {
+            "worksheet": worksheet_title,
+            "ranges": [{"range": r, "values": v} for r, v in zip(ranges, results)]
+        })
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
+
+
+# ------------------ 4.15: Delete a Range of Rows --------------------
+@app.delete("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/rows", tags=["Worksheets"])
+async def delete_rows(
+    spreadsheet_id: str,
+    worksheet_title: str,
+    start: int = Query(..., ge=1, le=MAX_ROWS, description="First row to delete"),
+    end: int = Query(..., ge=1, le=MAX_ROWS, description="Last row to delete (inclusive)")
+):
+    """
+    **Delete Rows**
+
+    Delete a contiguous range of rows from a worksheet with a single Google API call.
+
+    **Example:**  
+    DELETE `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/rows?start=5&end=9`
+    """
+    try:
+        await delete_row_range(spreadsheet_id, worksheet_title, start, end)
+        return {"message": f"Rows {start} to {end} deleted."}
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
+
+
+# ------------------ 4.16: Delete a Range of Columns --------------------
+@app.delete("/spreadsheets/{spreadsheet_id}/worksheets/{worksheet_title}/columns", tags=["Worksheets"])
+async def delete_columns(
+    spreadsheet_id: str,
+    worksheet_title: str,
+    start: Annotated[ColumnIndex, Query(description="First column to delete, e.g. `B`")],
+    end: Annotated[ColumnIndex, Query(description="Last column to delete (inclusive), e.g. `D`")]
+):
+    """
+    **Delete Columns**
+
+    Delete a contiguous range of columns from a worksheet with a single Google API call.
+
+    **Example:**  
+    DELETE `/spreadsheets/{spreadsheet_id}/worksheets/Sheet1/columns?start=B&end=D`
+    """
+    try:
+        await delete_column_range(spreadsheet_id, worksheet_title, start, end)
+        return {"message": f"Columns {column_index_to_letter(start)} to {column_index_to_letter(end)} deleted."}
+    except GOOGLE_API_ERRORS as e:
+        raise google_error_to_http(e)
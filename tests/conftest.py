@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def gc(monkeypatch):
+    """
+    A mocked gspread client in place of the real one, with empty caches.
+    """
+    client = MagicMock()
+    monkeypatch.setattr(main, "get_gc", lambda: client)
+    main._spreadsheet_cache.clear()
+    main._worksheet_cache.clear()
+    main._read_cache.clear()
+    main._inflight_reads.clear()
+    return client
+
+
+@pytest.fixture
+def ws(gc):
+    """
+    The Worksheet every get_ws() lookup resolves to.
+    """
+    return gc.open_by_key.return_value.worksheet.return_value
+
+
+@pytest.fixture
+def client(gc):
+    return TestClient(main.app)
@@ -0,0 +1,451 @@
+import asyncio
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from gspread.exceptions import APIError, WorksheetNotFound
+
+import main
+
+BASE = "/spreadsheets/sid/worksheets/Sheet1"
+
+
+# ------------------ Delete a Range of Columns --------------------
+def test_delete_columns_converts_letters_to_indexes(client, ws):
+    response = client.delete(f"{BASE}/columns?start=b&end=d")
+    assert response.status_code == 200
+    assert response.json() == {"message": "Columns B to D deleted."}
+    ws.delete_columns.assert_called_once_with(2, 4)
+
+
+def test_delete_columns_rejects_non_letters(client, ws):
+    assert client.delete(f"{BASE}/columns?start=1&end=2").status_code == 422
+    assert client.delete(f"{BASE}/columns?start=zzzz&end=a").status_code == 422
+    ws.delete_columns.assert_not_called()
+
+
+def test_delete_columns_rejects_reversed_range(client, ws):
+    response = client.delete(f"{BASE}/columns?start=D&end=B")
+    assert response.status_code == 400
+    ws.delete_columns.assert_not_called()
+
+
+# ------------------ Credential Refresh --------------------
+def run_refresh_cycles(monkeypatch, cycles=1):
+    """
+    Run keep_credentials_fresh() for `cycles` iterations and return its delays.
+    """
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == cycles:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(main.asyncio, "sleep", fake_sleep)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main.keep_credentials_fresh())
+    return delays
+
+
+def run_one_refresh_cycle(monkeypatch, creds):
+    monkeypatch.setattr(main, "get_creds", lambda: creds)
+    return run_refresh_cycles(monkeypatch)[0]
+
+
+def test_refresh_happens_before_google_auth_would_refresh_inline(monkeypatch):
+    creds = MagicMock(valid=True)
+    # Still valid for google-auth, but inside the background refresh margin.
+    creds.expiry = main.utcnow() + main.GOOGLE_AUTH_REFRESH_THRESHOLD + datetime.timedelta(seconds=30)
+
+    def refresh(request):
+        creds.expiry = main.utcnow() + datetime.timedelta(hours=1)
+    creds.refresh.side_effect = refresh
+
+    delay = run_one_refresh_cycle(monkeypatch, creds)
+    creds.refresh.assert_called_once()
+    expected = (datetime.timedelta(hours=1) - main.CREDENTIALS_REFRESH_MARGIN).total_seconds()
+    assert expected - 5 < delay <= expected
+
+
+def test_refresh_waits_until_margin(monkeypatch):
+    creds = MagicMock(valid=True)
+    creds.expiry = main.utcnow() + datetime.timedelta(minutes=30)
+    delay = run_one_refresh_cycle(monkeypatch, creds)
+    creds.refresh.assert_not_called()
+    assert delay > 0
+    assert main.utcnow() + datetime.timedelta(seconds=delay) + main.GOOGLE_AUTH_REFRESH_THRESHOLD < creds.expiry
+
+
+
+def test_missing_config_is_logged_once(monkeypatch, caplog):
+    monkeypatch.setattr(main, "_creds", None)
+    monkeypatch.delenv("SERVICE_ACCOUNT_B64", raising=False)
+    with caplog.at_level("WARNING", logger="main"):
+        delays = run_refresh_cycles(monkeypatch, cycles=3)
+    assert delays == [main.CREDENTIALS_RETRY_DELAY] * 3
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelname == "WARNING"
+    assert caplog.records[0].exc_info is None
+
+# ------------------ Client Construction --------------------
+def test_concurrent_cold_get_gc_builds_one_client(monkeypatch):
+    built = []
+
+    def slow_build():
+        time.sleep(0.05)
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(main, "_gc", None)
+    monkeypatch.setattr(main, "_build_gc", slow_build)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: main.get_gc(), range(8)))
+    assert len(built) == 1
+    assert all(c is built[0] for c in clients)
+
+
+def test_missing_service_account_is_a_503_and_not_cached(monkeypatch):
+    monkeypatch.setattr(main, "_creds", None)
+    monkeypatch.delenv("SERVICE_ACCOUNT_B64", raising=False)
+    with pytest.raises(HTTPException) as excinfo:
+        main.get_creds()
+    assert excinfo.value.status_code == 503
+    assert main._creds is None
+
+
+# ------------------ Title-Addressed Values API --------------------
+def test_get_row_is_one_values_call(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["a", "b"]]}]}
+    response = client.get(f"{BASE}/row/5")
+    assert response.json() == {"row": 5, "values": ["a", "b"]}
+    gc.http_client.values_batch_get.assert_called_once_with(
+        "sid", ["'Sheet1'!5:5"], params={"majorDimension": "ROWS"}
+    )
+    gc.open_by_key.assert_not_called()
+
+
+def test_get_column_reads_by_column(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["x", "", "z"]]}]}
+    response = client.get(f"{BASE}/column/b")
+    assert response.json() == {"column": "B", "values": ["x", "", "z"]}
+    gc.http_client.values_batch_get.assert_called_once_with(
+        "sid", ["'Sheet1'!B:B"], params={"majorDimension": "COLUMNS"}
+    )
+    gc.open_by_key.assert_not_called()
+
+
+def test_get_empty_row(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{}]}
+    assert client.get(f"{BASE}/row/7").json() == {"row": 7, "values": []}
+
+
+def test_update_row_writes_raw_values(client, gc):
+    response = client.patch(f"{BASE}/row/3", json={"values": ["1", "=A1"]})
+    assert response.status_code == 200
+    gc.http_client.values_batch_update.assert_called_once_with("sid", body={
+        "valueInputOption": "RAW",
+        "data": [{"range": "'Sheet1'!A3:B3", "values": [["1", "=A1"]]}],
+    })
+    gc.open_by_key.assert_not_called()
+
+
+def test_update_column_writes_raw_values(client, gc):
+    response = client.patch(f"{BASE}/column/c", json={"values": ["1", "2"]})
+    assert response.status_code == 200
+    gc.http_client.values_batch_update.assert_called_once_with("sid", body={
+        "valueInputOption": "RAW",
+        "data": [{"range": "'Sheet1'!C1:C2", "values": [["1"], ["2"]]}],
+    })
+    gc.open_by_key.assert_not_called()
+
+
+# ------------------ Read Coalescing --------------------
+def test_concurrent_identical_reads_share_one_call():
+    calls = []
+
+    def read():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    async def scenario():
+        return await asyncio.gather(*[main.coalesced_read(("s", "t", "k"), read) for _ in range(5)])
+
+    main._read_cache.clear()
+    assert asyncio.run(scenario()) == ["value"] * 5
+    assert len(calls) == 1
+    main._read_cache.clear()
+
+
+def test_write_during_inflight_read_is_not_cached():
+    started = threading.Event()
+    release = threading.Event()
+    results = iter(["before write", "after write"])
+
+    def read():
+        value = next(results)
+        started.set()
+        release.wait(1)
+        return value
+
+    async def scenario():
+        key = ("s", "t", "k")
+        stale = asyncio.ensure_future(main.coalesced_read(key, read))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 1)
+        main.invalidate_reads("s", "t")
+        release.set()
+        assert await stale == "before write"
+        return await main.coalesced_read(key, read)
+
+    main._read_cache.clear()
+    assert asyncio.run(scenario()) == "after write"
+    main._read_cache.clear()
+
+
+# ------------------ Path Parameter Validation --------------------
+def test_malformed_cell_address_is_rejected_locally(client, gc):
+    assert client.get(f"{BASE}/cell/B14junk").status_code == 422
+    assert client.get(f"{BASE}/cell/B0").status_code == 422
+    gc.http_client.values_batch_get.assert_not_called()
+
+
+def test_cell_address_is_upper_cased(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["hi"]]}]}
+    response = client.get(f"{BASE}/cell/b14")
+    assert response.json() == {"cell": "B14", "value": "hi"}
+    gc.http_client.values_batch_get.assert_called_once_with(
+        "sid", ["'Sheet1'!B14"], params={"majorDimension": "ROWS"}
+    )
+
+
+def test_invalid_column_and_row_are_rejected_locally(client, gc):
+    assert client.get(f"{BASE}/column/B1").status_code == 422
+    assert client.get(f"{BASE}/column/ABCD").status_code == 422
+    assert client.get(f"{BASE}/row/0").status_code == 422
+    gc.http_client.values_batch_get.assert_not_called()
+
+
+def test_row_numbers_are_bounded(client, gc, ws):
+    assert client.get(f"{BASE}/row/99999999999999999999").status_code == 422
+    assert client.get(f"{BASE}/row/10000001").status_code == 422
+    assert client.get(f"{BASE}?start_row=0&end_row=-3").status_code == 422
+    assert client.get(f"{BASE}?start_row=1&end_row=10000001").status_code == 422
+    assert client.delete(f"{BASE}/rows?start=0&end=2").status_code == 422
+    assert client.delete(f"{BASE}/rows?start=1&end=10000001").status_code == 422
+    gc.http_client.values_batch_get.assert_not_called()
+    ws.get.assert_not_called()
+    ws.delete_rows.assert_not_called()
+
+
+# ------------------ ETag / Conditional GET --------------------
+def test_matching_if_none_match_returns_304(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["a"]]}]}
+    first = client.get(f"{BASE}/row/1")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    second = client.get(f"{BASE}/row/1", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_stale_if_none_match_returns_body(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["a"]]}]}
+    response = client.get(f"{BASE}/row/1", headers={"If-None-Match": 'W/"outdated"'})
+    assert response.status_code == 200
+    assert response.json() == {"row": 1, "values": ["a"]}
+
+
+def test_large_responses_are_gzipped(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["x" * 2000]]}]}
+    response = client.get(f"{BASE}/row/1", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+# ------------------ Google Error Translation --------------------
+def api_error(status_code, headers=None, message="boom"):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.json.return_value = {"error": {"code": status_code, "message": message, "status": "X"}}
+    return APIError(response)
+
+
+def test_rate_limit_becomes_503_with_retry_after(client, gc):
+    gc.http_client.values_batch_get.side_effect = api_error(429, {"Retry-After": "7"})
+    response = client.get(f"{BASE}/row/1")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+
+
+def test_client_errors_keep_googles_status(client, gc):
+    gc.http_client.values_batch_get.side_effect = api_error(403)
+    assert client.get(f"{BASE}/row/1").status_code == 403
+    gc.http_client.values_batch_get.side_effect = api_error(404)
+    assert client.get(f"{BASE}/row/2").status_code == 404
+
+
+def test_rejected_service_credentials_are_502_not_401(client, gc):
+    gc.http_client.values_batch_get.side_effect = api_error(401)
+    assert client.get(f"{BASE}/row/1").status_code == 502
+
+
+def test_google_server_errors_become_502(client, gc):
+    gc.http_client.values_batch_update.side_effect = api_error(500)
+    assert client.patch(f"{BASE}/cell/A1", json={"value": "x"}).status_code == 502
+
+
+def test_missing_worksheet_is_404(client, gc):
+    gc.open_by_key.return_value.worksheet.side_effect = WorksheetNotFound("Sheet1")
+    assert client.delete(f"{BASE}/row/1").status_code == 404
+
+
+def test_unexpected_errors_are_not_masked_as_400(gc):
+    gc.http_client.values_batch_get.side_effect = RuntimeError("bug")
+    response = TestClient(main.app, raise_server_exceptions=False).get(f"{BASE}/row/1")
+    assert response.status_code == 500
+
+
+def test_unknown_worksheet_is_404_on_both_lookup_paths(client, gc):
+    # Title-addressed values API call.
+    gc.http_client.values_batch_get.side_effect = api_error(400, message="Unable to parse range: 'Nope'!5:5")
+    assert client.get("/spreadsheets/sid/worksheets/Nope/row/5").status_code == 404
+    # Worksheet lookup through get_ws().
+    gc.open_by_key.return_value.worksheet.side_effect = WorksheetNotFound("Nope")
+    assert client.get("/spreadsheets/sid/worksheets/Nope").status_code == 404
+
+
+def test_other_bad_requests_keep_400(client, gc):
+    gc.http_client.values_batch_get.side_effect = api_error(400, message="Invalid request")
+    assert client.get(f"{BASE}/row/1").status_code == 400
+
+
+# ------------------ Batch Endpoints --------------------
+def test_batch_update_maps_items_to_one_values_call(client, gc):
+    response = client.patch(f"{BASE}/batch", json=[
+        {"range": "b14", "values": [["hi"]]},
+        {"range": "A1:B2", "values": [["1", "2"], ["3", "4"]]},
+    ])
+    assert response.status_code == 200
+    assert response.json()["ranges"] == ["B14", "A1:B2"]
+    gc.http_client.values_batch_update.assert_called_once_with("sid", body={
+        "valueInputOption": "USER_ENTERED",
+        "data": [
+            {"range": "'Sheet1'!B14", "values": [["hi"]]},
+            {"range": "'Sheet1'!A1:B2", "values": [["1", "2"], ["3", "4"]]},
+        ],
+    })
+
+
+def test_batch_update_rejects_empty_body(client, gc):
+    assert client.patch(f"{BASE}/batch", json=[]).status_code == 400
+    gc.http_client.values_batch_update.assert_not_called()
+
+
+def test_batch_ranges_must_be_plain_a1(client, gc):
+    for bad in ["Other!B14", "B14junk", "A0"]:
+        assert client.patch(f"{BASE}/batch", json=[{"range": bad, "values": [["x"]]}]).status_code == 422
+        assert client.get(f"{BASE}/batch", params={"ranges": bad}).status_code == 422
+    gc.http_client.values_batch_update.assert_not_called()
+    gc.http_client.values_batch_get.assert_not_called()
+
+
+def test_batch_get_keeps_request_order(client, gc):
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [
+        {"values": [["c3"]]}, {}, {"values": [["a1", "b1"]]},
+    ]}
+    response = client.get(f"{BASE}/batch", params={"ranges": ["c3", "D:D", "A1:B1"]})
+    assert response.json() == {"worksheet": "Sheet1", "ranges": [
+        {"range": "C3", "values": [["c3"]]},
+        {"range": "D:D", "values": []},
+        {"range": "A1:B1", "values": [["a1", "b1"]]},
+    ]}
+    gc.http_client.values_batch_get.assert_called_once_with(
+        "sid", ["'Sheet1'!C3", "'Sheet1'!D:D", "'Sheet1'!A1:B1"], params={"majorDimension": "ROWS"}
+    )
+
+
+# ------------------ Worksheet Data --------------------
+def test_worksheet_data_spans_actual_columns_unformatted(client, ws):
+    ws.col_count = 30
+    ws.get.return_value = [[1, "a"], [2, "b"]]
+    response = client.get(f"{BASE}?start_row=1&end_row=3")
+    assert response.json() == {"worksheet": "Sheet1", "range": "A1:AD3", "data": [[1, "a"], [2, "b"]]}
+    ws.get.assert_called_once_with("A1:AD3", major_dimension="ROWS", value_render_option="UNFORMATTED_VALUE")
+
+
+# ------------------ List Worksheets --------------------
+def test_list_worksheets_maps_masked_metadata(client, gc):
+    gc.http_client.fetch_sheet_metadata.return_value = {"sheets": [
+        {"properties": {"sheetId": 0, "title": "Sheet1", "gridProperties": {"rowCount": 100, "columnCount": 26}}},
+        {"properties": {"sheetId": 7, "title": "Data", "gridProperties": {"rowCount": 5, "columnCount": 3}}},
+    ]}
+    response = client.get("/spreadsheets/sid/worksheets")
+    assert response.json() == {"worksheets": [
+        {"title": "Sheet1", "id": 0, "rows": 100, "cols": 26},
+        {"title": "Data", "id": 7, "rows": 5, "cols": 3},
+    ]}
+    gc.http_client.fetch_sheet_metadata.assert_called_once_with(
+        "sid", params={"includeGridData": "false", "fields": main.WORKSHEET_METADATA_FIELDS}
+    )
+    assert main.WORKSHEET_METADATA_FIELDS == (
+        "sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))"
+    )
+    gc.open_by_key.assert_not_called()
+
+
+# ------------------ Column Lookup Tables --------------------
+def test_column_table_boundaries():
+    assert main.column_index_to_letter(1) == "A"
+    assert main.column_index_to_letter(26) == "Z"
+    assert main.column_index_to_letter(27) == "AA"
+    assert main.column_index_to_letter(18278) == "ZZZ"
+    assert main.column_letter_to_index("zzz") == 18278
+
+
+@pytest.mark.parametrize("index", [0, -1, 18279])
+def test_out_of_range_column_index_is_422(index):
+    with pytest.raises(HTTPException) as excinfo:
+        main.column_index_to_letter(index)
+    assert excinfo.value.status_code == 422
+
+
+@pytest.mark.parametrize("letter", ["", "AAAA", "A1"])
+def test_invalid_column_letter_is_422(letter):
+    with pytest.raises(HTTPException) as excinfo:
+        main.column_letter_to_index(letter)
+    assert excinfo.value.status_code == 422
+
+
+def test_column_tables_round_trip():
+    for index in range(1, main.MAX_COLUMNS + 1):
+        assert main.column_letter_to_index(main.column_index_to_letter(index)) == index
+
+
+# ------------------ Request Body Models --------------------
+def test_unknown_body_fields_are_rejected(client, gc):
+    response = client.patch(f"{BASE}/cell/A1", json={"value": "x", "extra": 1})
+    assert response.status_code == 422
+    gc.http_client.values_batch_update.assert_not_called()
+
+
+def test_cell_values_are_capped_at_50000_characters(client, gc):
+    assert client.patch(f"{BASE}/cell/A1", json={"value": "x" * 50001}).status_code == 422
+    assert client.patch(f"{BASE}/row/1", json={"values": ["x" * 50001]}).status_code == 422
+    gc.http_client.values_batch_update.assert_not_called()
+    assert client.patch(f"{BASE}/cell/A1", json={"value": "x" * 50000}).status_code == 200
+
+
+# ------------------ Lifespan --------------------
+def test_app_can_start_and_stop_repeatedly(monkeypatch, gc):
+    monkeypatch.setattr(main, "_creds", None)
+    monkeypatch.delenv("SERVICE_ACCOUNT_B64", raising=False)
+    gc.http_client.values_batch_get.return_value = {"valueRanges": [{"values": [["a"]]}]}
+    for row in (1, 2):
+        with TestClient(main.app) as client:
+            assert client.get(f"{BASE}/row/{row}").status_code == 200